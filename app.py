@@ -1,6 +1,7 @@
 import os
 import re
 import json
+import logging
 from pathlib import Path
 import requests
 from bs4 import BeautifulSoup
@@ -9,8 +10,10 @@ from email.message import EmailMessage
 import smtplib
 import ssl
 from PyPDF2 import PdfReader
+from records import to_records, to_plain, source_key, dump_snapshot, load_snapshot
 
 app = Flask(__name__)
+log = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).parent
 STATIC_DIR = BASE_DIR / "static"
@@ -18,7 +21,9 @@ IMG_DIR = STATIC_DIR / "images"
 PROJECT_IMG_DIR = IMG_DIR / "projects"
 RESUME_PATH = BASE_DIR / "Zuber_Resume_09.pdf"
 PHOTO_PATH = BASE_DIR / "phottoo.jpg"
+# data.json is hand-editable; extra keys on entries are kept and reach the template
 DATA_CACHE = BASE_DIR / "data.json"
+DATA_SNAPSHOT = BASE_DIR / "data.bin"
 
 KNOWN_SKILLS = [
     "JavaScript",
@@ -577,21 +582,61 @@ def build_data() -> dict:
         "photo": profile_photo,
         "roles": roles,
     }
-    return data
+    return to_records(data)
+
+
+# (source key, data) of the last load, reused until data.json changes
+_loaded = None
+# flipped off after the first failed write, e.g. on read-only deploys like Vercel
+_snapshot_writable = True
+
+
+def _save_snapshot(data: dict, key: tuple) -> None:
+    global _snapshot_writable
+    if not _snapshot_writable:
+        return
+    try:
+        dump_snapshot(data, DATA_SNAPSHOT, key)
+    except Exception as e:
+        _snapshot_writable = False
+        log.warning("Snapshot disabled, cannot write %s: %s", DATA_SNAPSHOT.name, e)
 
 
 def load_data() -> dict:
+    global _loaded
     if DATA_CACHE.exists():
+        # data.json stays the editable source; data.bin is a marshal snapshot of it
+        key = source_key(DATA_CACHE)
+        if _loaded is not None and _loaded[0] == key:
+            return _loaded[1]
+        data = load_snapshot(DATA_SNAPSHOT, key)
+        if data is not None:
+            _loaded = (key, data)
+            return data
         try:
             with open(DATA_CACHE, "r", encoding="utf-8") as rf:
-                return json.load(rf)
+                raw = json.load(rf)
         except Exception:
-            pass
+            raw = None
+        if raw is not None:
+            # a record conversion bug must never regenerate over a hand-edited data.json
+            try:
+                data = to_records(raw)
+            except Exception:
+                log.exception("data.json record conversion failed, serving plain data")
+                data = raw
+            else:
+                _save_snapshot(data, key)
+            _loaded = (key, data)
+            return data
     data = build_data()
     try:
-        DATA_CACHE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        DATA_CACHE.write_text(json.dumps(to_plain(data), ensure_ascii=False, indent=2), encoding="utf-8")
     except Exception:
-        pass
+        return data
+    key = source_key(DATA_CACHE)
+    _save_snapshot(data, key)
+    _loaded = (key, data)
     return data
 
 
@@ -0,0 +1,101 @@
+"""Compare data.json load paths: plain dicts, records, and the marshal snapshot.
+
+Usage: python bench_records.py [data.json] [--copies N]
+
+Load time is the mean over many loads. Memory is peak RSS (ru_maxrss) of a
+child process that keeps N copies loaded, minus a child that keeps none.
+
+On the bundled data.json the snapshot is no faster than json.load into plain
+dicts; it only wins back the roughly 2x cost to_records adds on top of
+json.load. The measurable gain is memory: records hold about 25-30% less RSS
+than the nested dicts. Repeat requests in the app are served from memory.
+"""
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from records import to_records, to_plain, source_key, dump_snapshot, load_snapshot
+
+MODES = ("none", "json-dicts", "json-records", "snapshot-records")
+
+
+def check_roundtrip(source: Path, snapshot: Path) -> None:
+    raw = json.loads(source.read_text(encoding="utf-8"))
+    data = to_records(raw)
+    assert to_plain(data) == raw, "to_plain(to_records(data.json)) differs from data.json"
+    key = source_key(source)
+    dump_snapshot(data, snapshot, key)
+    assert load_snapshot(snapshot, key) == data, "snapshot round trip differs from records"
+
+
+def loader(mode: str, source: Path, snapshot: Path):
+    def json_dicts():
+        with open(source, "r", encoding="utf-8") as rf:
+            return json.load(rf)
+
+    if mode == "none":
+        return lambda: None
+    if mode == "json-dicts":
+        return json_dicts
+    if mode == "json-records":
+        return lambda: to_records(json_dicts())
+    return lambda: load_snapshot(snapshot, source_key(source))
+
+
+def time_us(fn, n: int = 2000) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def child(mode: str, source: Path, snapshot: Path, copies: int) -> None:
+    fn = loader(mode, source, snapshot)
+    kept = [fn() for _ in range(copies)]
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    if sys.platform == "darwin":
+        rss //= 1024
+    print(rss, len(kept))
+
+
+def peak_rss_kib(mode: str, source: Path, snapshot: Path, copies: int) -> int:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(source), str(snapshot), str(copies)],
+        check=True, capture_output=True, text=True, cwd=Path(__file__).parent,
+    ).stdout
+    return int(out.split()[0])
+
+
+def main(argv: list) -> None:
+    if argv[:1] == ["--child"]:
+        child(argv[1], Path(argv[2]), Path(argv[3]), int(argv[4]))
+        return
+    copies = 1000
+    if "--copies" in argv:
+        i = argv.index("--copies")
+        copies = int(argv[i + 1])
+        del argv[i:i + 2]
+    src = Path(argv[0]) if argv else Path(__file__).parent / "data.json"
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "data.json"
+        shutil.copy2(src, source)
+        snapshot = Path(tmp) / "data.bin"
+        check_roundtrip(source, snapshot)
+        print(f"data.json {source.stat().st_size} B, data.bin {snapshot.stat().st_size} B")
+        for mode in MODES[1:]:
+            print(f"{mode:18s} load {time_us(loader(mode, source, snapshot)):7.1f} us")
+        base = peak_rss_kib("none", source, snapshot, copies)
+        for mode in MODES[1:]:
+            rss = peak_rss_kib(mode, source, snapshot, copies) - base
+            print(f"{mode:18s} peak RSS for {copies} copies: +{rss / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,244 @@
+import logging
+import marshal
+import os
+import sys
+import tempfile
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"ZPS1"
+
+
+def _intern_all(values):
+    # only for short values that repeat across entries and resumes (tags, skills)
+    if values is None:
+        return None
+    if isinstance(values, str):
+        values = [values]
+    if not isinstance(values, (list, tuple)):
+        return ()
+    try:
+        return tuple(map(sys.intern, values))
+    except TypeError:
+        pass
+    out = []
+    for v in values:
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            v = str(v)
+        if isinstance(v, str):
+            out.append(sys.intern(v))
+    return tuple(out)
+
+
+def _as_tuple(values):
+    return tuple(values) if isinstance(values, list) else values
+
+
+class _Entry:
+    # Keys a hand-edited data.json entry carries beyond the record fields live
+    # in ``extra`` and read like attributes, so templates can use them directly.
+    # ``order`` remembers which keys the entry had so to_plain() can rebuild it.
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or name in ("extra", "order"):
+            raise AttributeError(name)
+        try:
+            return self.extra[name]
+        except (KeyError, TypeError):
+            raise AttributeError(name) from None
+
+
+@dataclass(slots=True)
+class Project(_Entry):
+    name: str = "Project"
+    url: str | None = None
+    description: str = "Project"
+    image: str | None = None
+    image_remote: str | None = None
+    tags: tuple = ()
+    highlights: tuple = ()
+    extra: dict | None = None
+    order: tuple = ()
+
+    def __post_init__(self):
+        self.tags = _intern_all(self.tags)
+        self.highlights = _as_tuple(self.highlights)
+
+
+@dataclass(slots=True)
+class EducationEntry(_Entry):
+    # parsed entries fill type/text, hand-edited ones degree/institution/description
+    type: str | None = None
+    text: str | None = None
+    period: str | None = None
+    degree: str | None = None
+    institution: str | None = None
+    description: str | None = None
+    extra: dict | None = None
+    order: tuple = ()
+
+    def __post_init__(self):
+        if isinstance(self.type, str):
+            self.type = sys.intern(self.type)
+
+
+@dataclass(slots=True)
+class JourneyItem(_Entry):
+    title: str = ""
+    text: str = ""
+    period: str | None = None
+    extra: dict | None = None
+    order: tuple = ()
+
+
+@dataclass(slots=True)
+class SkillGroups:
+    groups: dict
+
+    def __post_init__(self):
+        groups = self.groups
+        if not isinstance(groups, dict):
+            if groups:
+                log.warning("skills should map category -> list, ignoring %r", type(groups).__name__)
+            groups = {}
+        self.groups = {sys.intern(str(k)): _intern_all(v) for k, v in groups.items()}
+
+    def __getattr__(self, name: str):
+        # lets templates keep using data.skills.languages etc.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.groups[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key: str) -> tuple:
+        return self.groups[key]
+
+    def items(self):
+        return self.groups.items()
+
+
+RECORD_FIELDS = {
+    "projects": Project,
+    "education": EducationEntry,
+    "journey": JourneyItem,
+}
+
+# positional layout used by the snapshot, and the data.json keys each record owns
+_SLOTS = {cls: tuple(f.name for f in fields(cls)) for cls in RECORD_FIELDS.values()}
+_KNOWN = {cls: frozenset(names) - {"extra", "order"} for cls, names in _SLOTS.items()}
+_LAYOUT = tuple(_SLOTS.values())
+# entries of one section mostly share a key order; keep a single tuple for it
+_ORDERS = {}
+
+
+def _to_record(cls, item: dict):
+    known = _KNOWN[cls]
+    kwargs = {}
+    extra = {}
+    for k, v in item.items():
+        if k in known:
+            kwargs[k] = v
+        else:
+            extra[k] = v
+    order = tuple(item)
+    return cls(**kwargs, extra=extra or None, order=_ORDERS.setdefault(order, order))
+
+
+def to_records(data: dict) -> dict:
+    out = dict(data)
+    for key, cls in RECORD_FIELDS.items():
+        items = data.get(key)
+        if not isinstance(items, list):
+            if key in data and items is not None:
+                log.warning("data.json %s should be a list, leaving %r as is", key, type(items).__name__)
+            continue
+        rows = []
+        for item in items:
+            if not isinstance(item, dict):
+                log.warning("data.json %s entry is not an object, skipping: %r", key, item)
+                continue
+            rows.append(_to_record(cls, item))
+        out[key] = rows
+    if isinstance(data.get("skills"), dict):
+        out["skills"] = SkillGroups(data["skills"])
+    return out
+
+
+def _plain(v):
+    return list(v) if isinstance(v, tuple) else v
+
+
+def to_plain(data: dict) -> dict:
+    out = dict(data)
+    for key, cls in RECORD_FIELDS.items():
+        rows = data.get(key)
+        if not isinstance(rows, list):
+            continue
+        plain = []
+        for r in rows:
+            if not isinstance(r, cls):
+                plain.append(r)
+                continue
+            known = _KNOWN[cls]
+            # records built in code have no order; emit every field then
+            keys = r.order or [n for n in _SLOTS[cls] if n in known]
+            plain.append({k: _plain(getattr(r, k) if k in known else r.extra[k]) for k in keys})
+        out[key] = plain
+    skills = data.get("skills")
+    if isinstance(skills, SkillGroups):
+        out["skills"] = {k: _plain(v) for k, v in skills.items()}
+    return out
+
+
+def source_key(source: Path) -> tuple:
+    # the record layout is part of the key so reordering fields invalidates old snapshots
+    st = source.stat()
+    return (st.st_size, st.st_mtime_ns, sys.version_info[:2], marshal.version, _LAYOUT)
+
+
+def dump_snapshot(data: dict, path: Path, key: tuple) -> None:
+    # records are stored as positional tuples, everything else as-is
+    payload = dict(data)
+    for name, cls in RECORD_FIELDS.items():
+        rows = data.get(name)
+        if isinstance(rows, list):
+            slots = _SLOTS[cls]
+            payload[name] = [tuple(getattr(r, n) for n in slots) for r in rows]
+    skills = data.get("skills")
+    if isinstance(skills, SkillGroups):
+        payload["skills"] = skills.groups
+    blob = marshal.dumps((key, payload))
+    # a temp file per writer, so concurrent workers never publish each other's partial writes
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as tf:
+        tmp = tf.name
+        tf.write(SNAPSHOT_MAGIC + blob)
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_snapshot(path: Path, key: tuple) -> dict | None:
+    # marshal is only safe for files we wrote ourselves; the snapshot is a local cache
+    try:
+        raw = path.read_bytes()
+        if not raw.startswith(SNAPSHOT_MAGIC):
+            return None
+        stored, payload = marshal.loads(memoryview(raw)[len(SNAPSHOT_MAGIC):])
+        if stored != key:
+            return None
+        for name, cls in RECORD_FIELDS.items():
+            rows = payload.get(name)
+            if isinstance(rows, list):
+                payload[name] = [cls(*row) for row in rows]
+        if isinstance(payload.get("skills"), dict):
+            payload["skills"] = SkillGroups(payload["skills"])
+    except Exception:
+        return None
+    return payload
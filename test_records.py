@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+from records import SkillGroups, to_records, to_plain, source_key, dump_snapshot, load_snapshot
+
+DATA_JSON = Path(__file__).parent / "data.json"
+
+
+def test_data_json_round_trips_through_records_and_snapshot(tmp_path):
+    raw = json.loads(DATA_JSON.read_text(encoding="utf-8"))
+    data = to_records(raw)
+    assert to_plain(data) == raw
+    source = tmp_path / "data.json"
+    source.write_text(DATA_JSON.read_text(encoding="utf-8"), encoding="utf-8")
+    snapshot = tmp_path / "data.bin"
+    dump_snapshot(data, snapshot, source_key(source))
+    assert load_snapshot(snapshot, source_key(source)) == data
+
+
+def test_snapshot_is_ignored_after_data_json_changes(tmp_path):
+    source = tmp_path / "data.json"
+    source.write_text(DATA_JSON.read_text(encoding="utf-8"), encoding="utf-8")
+    snapshot = tmp_path / "data.bin"
+    dump_snapshot(to_records(json.loads(source.read_text(encoding="utf-8"))), snapshot, source_key(source))
+    source.write_text(source.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert load_snapshot(snapshot, source_key(source)) is None
+
+
+def test_to_plain_preserves_nulls_empty_lists_and_missing_sections():
+    raw = {
+        "projects": [{"name": "a", "url": None, "tags": [], "github": "https://github.com/a"}],
+        "journey": [{"period": None, "title": "x"}],
+        "skills": {},
+    }
+    assert to_plain(to_records(raw)) == raw
+    assert to_plain(to_records({"name": "only"})) == {"name": "only"}
+
+
+def test_unknown_keys_are_kept_and_readable_as_attributes():
+    project = to_records({"projects": [{"name": "a", "github": "https://github.com/a"}]})["projects"][0]
+    assert project.github == "https://github.com/a"
+    assert project.extra == {"github": "https://github.com/a"}
+
+
+def test_hand_edited_entries_are_tolerated():
+    data = to_records({
+        "journey": [{"title": None}, {"text": "no title"}, "junk"],
+        "projects": [{"tags": ["React", 3, None]}],
+        "skills": ["not", "a", "mapping"],
+    })
+    assert [(j.title, j.text) for j in data["journey"]] == [(None, ""), ("", "no title")]
+    assert data["projects"][0].tags == ("React", "3")
+    assert data["skills"] == ["not", "a", "mapping"]
+
+
+def test_skill_groups_expose_categories_as_attributes():
+    skills = SkillGroups({"languages": "Python", "tools": ["Git", None]})
+    assert skills.languages == ("Python",)
+    assert skills.tools == ("Git",)